@@ -6,14 +6,38 @@ This module contains all data classes, enums, and exceptions related to game rel
 TODO: just import the YACL package instead of copy-pasting the code
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+import hashlib
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses drop the per-instance __dict__ (dataclass(slots=True) needs Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_fromisoformat = datetime.fromisoformat
+
+def _parse_iso(value: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp, accepting the trailing 'Z' UTC designator."""
+    if value.endswith('Z'):
+        return _fromisoformat(value[:-1] + '+00:00')
+    return _fromisoformat(value)
+
+def _match_filename_rules(filename_lower: str, rules: Tuple, default: Enum) -> Enum:
+    """Return the value of the first (keywords, extensions, value) rule matching a lowercased filename."""
+    for keywords, suffixes, value in rules:
+        if filename_lower.endswith(suffixes):
+            return value
+        for keyword in keywords:
+            if keyword in filename_lower:
+                return value
+    return default
+
 class ReleaseError(Exception):
     """Custom exception for release management errors."""
     pass
@@ -34,18 +58,20 @@ class AssetPlatform(Enum):
     @classmethod
     def infer_from_filename(cls, filename: str) -> 'AssetPlatform':
         """Infer the platform from asset filename."""
-        filename_lower = filename.lower()
-
-        if "android" in filename_lower or filename_lower.endswith(".apk"):
-            return AssetPlatform.ANDROID
-        elif "windows" in filename_lower or filename_lower.endswith(".zip"):
-            return AssetPlatform.WINDOWS
-        elif "linux" in filename_lower or filename_lower.endswith(".tar.gz"):
-            return AssetPlatform.LINUX
-        elif any(x in filename_lower for x in ("osx", "macos")) or filename_lower.endswith(".dmg"):
-            return AssetPlatform.MACOS
-        else:
-            return AssetPlatform.UNKNOWN
+        return cls._infer_from_lower(filename.lower())
+
+    @classmethod
+    def _infer_from_lower(cls, filename_lower: str) -> 'AssetPlatform':
+        """Infer the platform from an already lowercased asset filename."""
+        return _match_filename_rules(filename_lower, _PLATFORM_RULES, AssetPlatform.UNKNOWN)
+
+# Checked in order, first match wins
+_PLATFORM_RULES = (
+    (("android",), (".apk",), AssetPlatform.ANDROID),
+    (("windows",), (".zip",), AssetPlatform.WINDOWS),
+    (("linux",), (".tar.gz",), AssetPlatform.LINUX),
+    (("osx", "macos"), (".dmg",), AssetPlatform.MACOS),
+)
 
 class AssetArch(Enum):
     """Supported architectures for release assets."""
@@ -59,20 +85,21 @@ class AssetArch(Enum):
     @classmethod
     def infer_from_filename(cls, filename: str) -> 'AssetArch':
         """Infer the architecture from asset filename."""
-        filename_lower = filename.lower()
-
-        if any(arch in filename_lower for arch in ("universal", "bundle")):
-            return AssetArch.UNIVERSAL
-        elif any(arch in filename_lower for arch in ("arm32", "aarch32", "android-x32")):
-            return AssetArch.ARM32
-        elif any(arch in filename_lower for arch in ("arm64", "aarch64", "android-x64", "arm")):
-            return AssetArch.ARM64
-        elif any(arch in filename_lower for arch in ("x64", "amd64")):
-            return AssetArch.X64
-        elif any(arch in filename_lower for arch in ("x32", "x86")):
-            return AssetArch.X32
-        else:
-            return AssetArch.UNKNOWN
+        return cls._infer_from_lower(filename.lower())
+
+    @classmethod
+    def _infer_from_lower(cls, filename_lower: str) -> 'AssetArch':
+        """Infer the architecture from an already lowercased asset filename."""
+        return _match_filename_rules(filename_lower, _ARCH_RULES, AssetArch.UNKNOWN)
+
+# Checked in order, first match wins
+_ARCH_RULES = (
+    (("universal", "bundle"), (), AssetArch.UNIVERSAL),
+    (("arm32", "aarch32", "android-x32"), (), AssetArch.ARM32),
+    (("arm64", "aarch64", "android-x64", "arm"), (), AssetArch.ARM64),
+    (("x64", "amd64"), (), AssetArch.X64),
+    (("x32", "x86"), (), AssetArch.X32),
+)
 
 class AssetGraphics(Enum):
     """Supported graphics types for release assets."""
@@ -83,14 +110,18 @@ class AssetGraphics(Enum):
     @classmethod
     def infer_from_filename(cls, filename: str) -> 'AssetGraphics':
         """Infer the graphics type from asset filename."""
-        filename_lower = filename.lower()
+        return cls._infer_from_lower(filename.lower())
 
-        if any(graphics in filename_lower for graphics in ("with-graphics", "graphics", "tiles", "android")):
-            return AssetGraphics.TILES
-        elif any(graphics in filename_lower for graphics in ("ascii", "curses", "terminal-only")):
-            return AssetGraphics.ASCII
-        else:
-            return AssetGraphics.UNKNOWN
+    @classmethod
+    def _infer_from_lower(cls, filename_lower: str) -> 'AssetGraphics':
+        """Infer the graphics type from an already lowercased asset filename."""
+        return _match_filename_rules(filename_lower, _GRAPHICS_RULES, AssetGraphics.UNKNOWN)
+
+# Checked in order, first match wins
+_GRAPHICS_RULES = (
+    (("with-graphics", "graphics", "tiles", "android"), (), AssetGraphics.TILES),
+    (("ascii", "curses", "terminal-only"), (), AssetGraphics.ASCII),
+)
 
 class AssetSounds(Enum):
     """Supported sounds types for release assets."""
@@ -100,14 +131,40 @@ class AssetSounds(Enum):
     @classmethod
     def infer_from_filename(cls, filename: str) -> 'AssetSounds':
         """Infer the sounds type from asset filename."""
-        filename_lower = filename.lower()
-
-        if any(sounds in filename_lower for sounds in ("with-sounds", "sounds", "and-sounds")):
-            return AssetSounds.SOUNDS
-        else:
-            return AssetSounds.UNKNOWN
+        return cls._infer_from_lower(filename.lower())
 
-@dataclass
+    @classmethod
+    def _infer_from_lower(cls, filename_lower: str) -> 'AssetSounds':
+        """Infer the sounds type from an already lowercased asset filename."""
+        return _match_filename_rules(filename_lower, _SOUNDS_RULES, AssetSounds.UNKNOWN)
+
+# Checked in order, first match wins
+_SOUNDS_RULES = (
+    (("with-sounds", "sounds", "and-sounds"), (), AssetSounds.SOUNDS),
+)
+
+# Fingerprint of the rule tables; it changes with any rule edit, so reprocess_assets.py
+# reclassifies existing databases without a version having to be bumped by hand
+CLASSIFIER_VERSION = hashlib.sha256(
+    repr((_PLATFORM_RULES, _ARCH_RULES, _GRAPHICS_RULES, _SOUNDS_RULES)).encode()
+).hexdigest()[:16]
+
+def _classify_lower(filename_lower: str) -> Tuple[AssetPlatform, AssetArch, AssetGraphics, AssetSounds]:
+    """Infer platform, architecture, graphics and sounds from an already lowercased asset filename."""
+    return (
+        AssetPlatform._infer_from_lower(filename_lower),
+        AssetArch._infer_from_lower(filename_lower),
+        AssetGraphics._infer_from_lower(filename_lower),
+        AssetSounds._infer_from_lower(filename_lower),
+    )
+
+
+@lru_cache(maxsize=8192)
+def classify_filename(filename: str) -> Tuple[AssetPlatform, AssetArch, AssetGraphics, AssetSounds]:
+    """Infer platform, architecture, graphics and sounds from an asset filename in a single pass."""
+    return _classify_lower(filename.lower())
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ReleaseAsset:
     """Represents a downloadable asset from a release."""
     name: str = ""
@@ -117,8 +174,8 @@ class ReleaseAsset:
     arch: Optional[AssetArch] = None
     graphics: Optional[AssetGraphics] = None
     sounds: Optional[AssetSounds] = None
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the ReleaseAsset object to a dictionary."""
@@ -126,12 +183,13 @@ class ReleaseAsset:
             "name": self.name,
             "size": self.size,
             "download_url": self.download_url,
-            "platform": self.platform.value if self.platform else None,
-            "arch": self.arch.value if self.arch else None,
-            "graphics": self.graphics.value if self.graphics else None,
-            "sounds": self.sounds.value if self.sounds else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            # _value_ is the member attribute behind the .value property, without the descriptor overhead
+            "platform": self.platform._value_ if self.platform else None,
+            "arch": self.arch._value_ if self.arch else None,
+            "graphics": self.graphics._value_ if self.graphics else None,
+            "sounds": self.sounds._value_ if self.sounds else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
     
     @staticmethod
@@ -155,34 +213,35 @@ class ReleaseAsset:
             try:
                 asset.created_at = datetime.fromisoformat(data['created_at'])
             except (ValueError, TypeError):
-                asset.created_at = datetime.now()
+                pass
 
         if data.get('updated_at'):
             try:
                 asset.updated_at = datetime.fromisoformat(data['updated_at'])
             except (ValueError, TypeError):
-                asset.updated_at = datetime.now()
+                pass
 
         return asset
 
-    def from_github_data(self, data: Dict[str, Any]):
+    @classmethod
+    def from_github_data(cls, data: Dict[str, Any]) -> 'ReleaseAsset':
         """Create a ReleaseAsset instance from GitHub API data."""
-        self._parse_github_asset_data(data)
+        # Every field is assigned by the parser, so skip the dataclass __init__ defaults
+        asset = cls.__new__(cls)
+        asset._parse_github_asset_data(data)
+        return asset
 
     def _parse_github_asset_data(self, asset_data: Dict[str, Any]):        
         """Parse a single asset from GitHub API response into a ReleaseAsset object."""
         self.name = asset_data["name"]
         self.size = asset_data["size"]
         self.download_url = asset_data["browser_download_url"]
-        self.created_at = datetime.fromisoformat(asset_data["created_at"].replace('Z', '+00:00'))
-        self.updated_at = datetime.fromisoformat(asset_data["updated_at"].replace('Z', '+00:00'))
+        self.created_at = _parse_iso(asset_data["created_at"])
+        self.updated_at = _parse_iso(asset_data["updated_at"])
 
-        self.platform = AssetPlatform.infer_from_filename(self.name)
-        self.arch = AssetArch.infer_from_filename(self.name)
-        self.graphics = AssetGraphics.infer_from_filename(self.name)
-        self.sounds = AssetSounds.infer_from_filename(self.name)
+        self.platform, self.arch, self.graphics, self.sounds = classify_filename(self.name)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GameRelease:
     """Represents a game release with metadata."""
     id: int = 0
@@ -207,7 +266,7 @@ class GameRelease:
             "name": self.name,
             "tag_name": self.tag_name,
             "prerelease": self.prerelease,
-            "channel": self.channel.value,
+            "channel": self.channel._value_,
             "game_type": self.game_type,
             "published_at": self.published_at.isoformat() if self.published_at else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
@@ -280,23 +339,21 @@ class GameRelease:
         # Parse timestamps
         if release_data.get("published_at"):
             try:
-                self.published_at = datetime.fromisoformat(release_data["published_at"].replace('Z', '+00:00'))
+                self.published_at = _parse_iso(release_data["published_at"])
             except (ValueError, TypeError):
                 pass
 
         if release_data.get("created_at"):
             try:
-                self.created_at = datetime.fromisoformat(release_data["created_at"].replace('Z', '+00:00'))
+                self.created_at = _parse_iso(release_data["created_at"])
             except (ValueError, TypeError):
                 pass
 
         # Parse assets
         for asset_data in release_data.get("assets", []):
             try:
-                asset = ReleaseAsset()
-                asset.from_github_data(asset_data)
-                self.assets.append(asset)
-            except Exception as e:
+                self.assets.append(ReleaseAsset.from_github_data(asset_data))
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
                 logger.warning(f"Failed to parse asset {asset_data.get('name', 'unknown')}: {e}")
                 continue
 
@@ -309,8 +366,66 @@ class GameRelease:
             return ReleaseChannel.EXPERIMENTAL
         return ReleaseChannel.STABLE
 
-    
-
-
+# Raw release fields whose string values repeat across a whole database
+_INTERNED_RELEASE_FIELDS = ("channel", "game_type")
+_INTERNED_ASSET_FIELDS = ("platform", "arch", "graphics", "sounds")
+
+def _intern_fields(data: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Return a dictionary with interned keys and interned string values for the given fields."""
+    interned = {sys.intern(key): value for key, value in data.items()}
+    for key in fields:
+        value = interned.get(key)
+        if isinstance(value, str):
+            interned[key] = sys.intern(value)
+    return interned
+
+def intern_release_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern the keys and repeated values of a raw release dictionary so releases share them in memory."""
+    release = _intern_fields(data, _INTERNED_RELEASE_FIELDS)
+    assets = release.get("assets")
+    if isinstance(assets, list):
+        release["assets"] = [
+            _intern_fields(asset, _INTERNED_ASSET_FIELDS) if isinstance(asset, dict) else asset
+            for asset in assets
+        ]
+    return release
+
+class LazyReleaseList:
+    """
+    List of releases whose GameRelease objects are only built when accessed.
+
+    Releases loaded from disk are kept as raw dictionaries; to_dicts() hands untouched
+    entries back as-is so they are never parsed and re-serialized.
+    """
+
+    def __init__(self, raw_releases: Optional[Iterable[Dict[str, Any]]] = None):
+        self._raw: List[Optional[Dict[str, Any]]] = list(raw_releases) if raw_releases is not None else []
+        self._materialized: Dict[int, GameRelease] = {}
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index: int) -> GameRelease:
+        if index < 0:
+            index += len(self._raw)
+        release = self._materialized.get(index)
+        if release is None:
+            release = GameRelease.from_dict(self._raw[index])
+            self._materialized[index] = release
+        return release
 
-    
\ No newline at end of file
+    def __iter__(self):
+        for index in range(len(self._raw)):
+            yield self[index]
+
+    def append(self, release: GameRelease) -> None:
+        """Append a new release."""
+        self._materialized[len(self._raw)] = release
+        self._raw.append(None)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return all releases as dictionaries, serializing only the materialized ones."""
+        return [
+            self._materialized[index].to_dict() if index in self._materialized else raw
+            for index, raw in enumerate(self._raw)
+        ]
@@ -7,75 +7,205 @@ Supports configurable filtering to capture only relevant version tags.
 """
 
 import json
+import os
 import re
+import signal
 import subprocess
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import argparse
 import logging
 import requests
-from release import GameRelease
+from requests.adapters import HTTPAdapter
+from release import GameRelease, LazyReleaseList, intern_release_data
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Kept low: GitHub's secondary rate limits throttle bursts of concurrent requests
+DEFAULT_MAX_WORKERS = 4
+
+# Retries of a request throttled with a Retry-After header before giving up on it for this run
+MAX_THROTTLE_RETRIES = 3
+
+# Releases per listing page, and pages listed beyond those needed to cover the wanted tags.
+# New tags sit at the head of the listing, so a few extra pages cover them; tags still
+# missing afterwards are looked up one by one rather than walking the whole history.
+LISTING_PAGE_SIZE = 100
+LISTING_EXTRA_PAGES = 2
+
+# Marks a tag whose release lookup failed transiently and must not be cached as failed
+_RETRY_LATER = object()
+
+# Sort date for releases without any timestamp (aware, like the parsed GitHub timestamps)
+EPOCH = datetime.fromtimestamp(0, timezone.utc)
+
+
+class GitHubAPIError(Exception):
+    """Raised when a GitHub API lookup fails for a reason that may not persist (throttling, server or network errors)."""
+    pass
 
 
 class GitHubAPIClient:
     """GitHub API client with rate limiting and error handling."""
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, max_connections: int = DEFAULT_MAX_WORKERS):
         self.session = requests.Session()
         self.base_url = "https://api.github.com"
+
+        # Keep one pooled connection per concurrent worker
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount("https://", adapter)
         
         if token:
             self.session.headers.update({"Authorization": f"token {token}"})
         
-        # Rate limiting tracking
+        # Rate limiting tracking (shared by concurrent requests)
         self.rate_limit_remaining = 5000
         self.rate_limit_reset = 0
+        self._rate_limit_lock = threading.Lock()
         
     def _handle_rate_limit(self, response: requests.Response) -> None:
         """Handle GitHub API rate limiting."""
-        self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-        self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
-        
-        if self.rate_limit_remaining < 10:
-            reset_time = self.rate_limit_reset - time.time()
-            if reset_time > 0:
-                logging.warning(f"Rate limit low ({self.rate_limit_remaining}). Waiting {reset_time:.0f}s")
-                time.sleep(reset_time + 1)
+        with self._rate_limit_lock:
+            self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
+            self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
+
+            # Sleeping while holding the lock also pauses the other workers until the reset
+            if self.rate_limit_remaining < 10:
+                reset_time = self.rate_limit_reset - time.time()
+                if reset_time > 0:
+                    logging.warning(f"Rate limit low ({self.rate_limit_remaining}). Waiting {reset_time:.0f}s")
+                    time.sleep(reset_time + 1)
     
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request, waiting out and retrying throttled responses that carry a Retry-After header."""
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            response = self.session.get(url, **kwargs)
+            self._handle_rate_limit(response)
+
+            if response.status_code not in (403, 429) or attempt == MAX_THROTTLE_RETRIES:
+                return response
+            try:
+                retry_after = float(response.headers['Retry-After'])
+            except (KeyError, ValueError):
+                return response
+
+            with self._rate_limit_lock:
+                logging.warning(f"Request throttled ({response.status_code}). Retrying in {retry_after:.0f}s")
+                time.sleep(retry_after)
+
+        return response
+
     def get_release_by_tag(self, git_repo: str, tag: str, game_type: str = "") -> Optional[GameRelease]:
-        """Get release information for a specific tag."""
+        """
+        Get release information for a specific tag.
+
+        Returns None if the tag has no release.
+
+        Raises:
+            GitHubAPIError: If the lookup failed for any other reason, so it can be retried later.
+        """
         url = f"{self.base_url}/repos/{git_repo}/releases/tags/{tag}"
 
         try:
-            response = self.session.get(url, timeout=30)
-            self._handle_rate_limit(response)
+            response = self._get(url, timeout=30)
+        except requests.RequestException as e:
+            raise GitHubAPIError(f"Request failed for tag {tag}: {e}") from e
 
-            if response.status_code == 200:
-                raw_data = response.json()
-                release = GameRelease()
-                release.from_github_data(raw_data, game_type)
-                return release
-            elif response.status_code == 404:
-                logging.debug(f"No release found for tag {tag}")
-                return None
-            else:
-                logging.warning(f"API error for tag {tag}: {response.status_code}")
-                return None
+        if response.status_code == 200:
+            return self.parse_release(response.json(), game_type)
+        elif response.status_code == 404:
+            logging.debug(f"No release found for tag {tag}")
+            return None
+        else:
+            raise GitHubAPIError(f"API error for tag {tag}: {response.status_code}")
+
+    def list_releases(self, git_repo: str, wanted_tags: Set[str],
+                      etag: Optional[str] = None) -> Tuple[Optional[str], Optional[Dict[str, Dict]]]:
+        """
+        List repository releases page by page (newest first) and collect the wanted tags.
+
+        Paging stops as soon as every wanted tag has been seen, or after enough pages to hold
+        the wanted tags plus LISTING_EXTRA_PAGES, so a wanted tag missing from the result may
+        still have an older release. The first page is requested conditionally on ``etag``.
+
+        Returns:
+            Tuple of the first page ETag and the raw releases keyed by tag name. The
+            releases are None if the first page is unchanged since ``etag`` or a request fails.
+        """
+        url = f"{self.base_url}/repos/{git_repo}/releases"
+        params = {"per_page": LISTING_PAGE_SIZE}
+        pages_left = -(-len(wanted_tags) // LISTING_PAGE_SIZE) + LISTING_EXTRA_PAGES
+        headers = {"If-None-Match": etag} if etag else {}
+        first_page_etag = None
+        releases_by_tag = {}
+        missing_tags = set(wanted_tags)
+
+        try:
+            while url and missing_tags and pages_left > 0:
+                pages_left -= 1
+                response = self._get(url, params=params, headers=headers, timeout=30)
+
+                if response.status_code == 304:
+                    logging.debug(f"Release listing for {git_repo} unchanged since last run")
+                    return etag, None
+                elif response.status_code != 200:
+                    logging.warning(f"API error listing releases for {git_repo}: {response.status_code}")
+                    return etag, None
+
+                if first_page_etag is None:
+                    first_page_etag = response.headers.get('ETag')
+
+                for raw_data in response.json():
+                    tag = raw_data.get("tag_name")
+                    if tag in missing_tags:
+                        releases_by_tag[tag] = raw_data
+                        missing_tags.discard(tag)
+
+                # The "next" link already carries the paging query parameters
+                next_link = response.links.get("next")
+                url = next_link["url"] if next_link else None
+                params = None
+                headers = {}
 
         except requests.RequestException as e:
-            logging.error(f"Request failed for tag {tag}: {e}")
-            return None
+            logging.error(f"Failed to list releases for {git_repo}: {e}")
+            return etag, None
+
+        return first_page_etag, releases_by_tag
+
+    @staticmethod
+    def parse_release(raw_data: Dict, game_type: str) -> GameRelease:
+        """Build a GameRelease from raw GitHub API release data."""
+        release = GameRelease()
+        release.from_github_data(raw_data, game_type)
+        return release
 
 
 class ReleaseDBBuilder:
     """Main application class for building release databases."""
     
-    def __init__(self, config_path: str, github_token: Optional[str] = None, fresh_games: Optional[List[str]] = None):
+    def __init__(self, config_path: str, github_token: Optional[str] = None, fresh_games: Optional[List[str]] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         self.config_path = Path(config_path)
-        self.github_client = GitHubAPIClient(github_token)
+        self.max_workers = max_workers
+        self.github_client = GitHubAPIClient(github_token, max_workers)
         self.config = self._load_config()
         self.fresh_games = set(fresh_games) if fresh_games else set()
+
+        # Database index, updated in memory per game and written once at the end of run()
+        self._index = self._load_database_index()
+        self._index_dirty = False
         
     def _load_config(self) -> Dict:
         """Load and validate configuration file."""
@@ -103,23 +233,52 @@ class ReleaseDBBuilder:
         repo_url = f"https://github.com/{git_repo}.git"
         try:
             cmd = ['git', 'ls-remote', '--tags', repo_url]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode != 0:
-                logging.error(f"Git command failed: {result.stderr}")
-                return []
-            
-            tags = []
-            for line in result.stdout.strip().split('\n'):
-                if line and 'refs/tags/' in line:
-                    # Extract tag name from "hash refs/tags/tagname"
-                    tag = line.split('refs/tags/')[-1]
-                    # Skip annotated tag references (ending with ^{})
-                    if not tag.endswith('^{}'):
-                        tags.append(tag)
-            
+            timeout = 60
+            # stderr goes to a temporary file so a chatty git cannot fill an unread pipe and stall
+            with tempfile.TemporaryFile(mode='w+') as stderr_file, \
+                    subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True,
+                                     start_new_session=True) as proc:
+                # Reading stdout blocks until every process holding it exits, so the timeout is
+                # enforced by killing git together with the remote helpers it spawned
+                timed_out = threading.Event()
+
+                def kill_on_timeout():
+                    try:
+                        if hasattr(os, 'killpg'):
+                            os.killpg(proc.pid, signal.SIGKILL)
+                        elif proc.poll() is None:
+                            proc.kill()
+                        else:
+                            return
+                    except ProcessLookupError:
+                        # git and its helpers already exited, so the output was read in full
+                        return
+                    timed_out.set()
+
+                timer = threading.Timer(timeout, kill_on_timeout)
+                timer.start()
+                try:
+                    tags = []
+                    for line in proc.stdout:
+                        # Extract tag name from "hash refs/tags/tagname"
+                        _, sep, tag = line.rstrip().rpartition('refs/tags/')
+                        # Skip annotated tag references (ending with ^{})
+                        if sep and not tag.endswith('^{}'):
+                            tags.append(tag)
+                    proc.wait()
+                finally:
+                    timer.cancel()
+
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+
+                if proc.returncode != 0:
+                    stderr_file.seek(0)
+                    logging.error(f"Git command failed: {stderr_file.read()}")
+                    return []
+
             return tags
-            
+
         except subprocess.TimeoutExpired:
             logging.error(f"Timeout getting tags from {repo_url}")
             return []
@@ -129,16 +288,20 @@ class ReleaseDBBuilder:
     
     def _filter_tags(self, tags: List[str], filters: List[str]) -> List[str]:
         """Filter tags using regex patterns."""
+        compiled_filters = []
+        for filter_pattern in filters:
+            try:
+                compiled_filters.append(re.compile(filter_pattern))
+            except re.error as e:
+                logging.warning(f"Invalid regex pattern '{filter_pattern}': {e}")
+
         filtered_tags = []
 
         for tag in tags:
-            for filter_pattern in filters:
-                try:
-                    if re.match(filter_pattern, tag):
-                        filtered_tags.append(tag)
-                        break  # Tag matches, no need to check other patterns
-                except re.error as e:
-                    logging.warning(f"Invalid regex pattern '{filter_pattern}': {e}")
+            for compiled_filter in compiled_filters:
+                if compiled_filter.match(tag):
+                    filtered_tags.append(tag)
+                    break  # Tag matches, no need to check other patterns
 
         return filtered_tags
 
@@ -164,6 +327,10 @@ class ReleaseDBBuilder:
         """Get the file path for a game's failed tags cache."""
         return self._get_game_directory(game_name) / f"{game_name}_failed_tags.json"
 
+    def _get_releases_etag_file_path(self, game_name: str) -> Path:
+        """Get the file path for a game's cached release listing ETag."""
+        return self._get_game_directory(game_name) / f"{game_name}_releases_etag.json"
+
     def _get_database_index_file_path(self) -> Path:
         """Get the file path for the database index."""
         return Path("db") / "index.json"
@@ -185,14 +352,13 @@ class ReleaseDBBuilder:
 
         return []
 
-    def _save_processed_tags(self, game_name: str, processed_tags: List[str]) -> None:
+    def _save_processed_tags(self, game_name: str, processed_tags: Set[str]) -> None:
         """Save the list of processed tags to cache."""
         self._ensure_game_directory(game_name)
         processed_tags_file = self._get_processed_tags_file_path(game_name)
 
         try:
-            with open(processed_tags_file, 'w') as f:
-                json.dump(sorted(processed_tags), f, indent=2)
+            self._dump_json(sorted(processed_tags), processed_tags_file)
             logging.debug(f"Saved {len(processed_tags)} processed tags to cache for {game_name}")
         except IOError as e:
             logging.error(f"Failed to save processed tags cache for {game_name}: {e}")
@@ -210,18 +376,40 @@ class ReleaseDBBuilder:
 
         return []
 
-    def _save_failed_tags(self, game_name: str, failed_tags: List[str]) -> None:
+    def _save_failed_tags(self, game_name: str, failed_tags: Set[str]) -> None:
         """Save the list of failed tags to cache."""
         self._ensure_game_directory(game_name)
         failed_tags_file = self._get_failed_tags_file_path(game_name)
 
         try:
-            with open(failed_tags_file, 'w') as f:
-                json.dump(sorted(failed_tags), f, indent=2)
+            self._dump_json(sorted(failed_tags), failed_tags_file)
             logging.debug(f"Saved {len(failed_tags)} failed tags to cache for {game_name}")
         except IOError as e:
             logging.error(f"Failed to save failed tags cache for {game_name}: {e}")
 
+    def _load_releases_etag(self, game_name: str) -> Optional[str]:
+        """Load the ETag of the last release listing from cache."""
+        etag_file = self._get_releases_etag_file_path(game_name)
+
+        if etag_file.exists():
+            try:
+                with open(etag_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logging.warning(f"Failed to load release listing ETag for {game_name}: {e}")
+
+        return None
+
+    def _save_releases_etag(self, game_name: str, etag: str) -> None:
+        """Save the ETag of the last release listing to cache."""
+        self._ensure_game_directory(game_name)
+        etag_file = self._get_releases_etag_file_path(game_name)
+
+        try:
+            self._dump_json(etag, etag_file)
+        except IOError as e:
+            logging.error(f"Failed to save release listing ETag for {game_name}: {e}")
+
     def _load_database_index(self) -> Dict[str, Dict[str, int]]:
         """Load the database index from file."""
         index_file = self._get_database_index_file_path()
@@ -243,31 +431,36 @@ class ReleaseDBBuilder:
         index_file.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(index_file, 'w') as f:
-                json.dump(index, f, indent=2, sort_keys=True)
+            self._dump_json(index, index_file)
             logging.debug(f"Updated database index with {len(index)} games")
         except IOError as e:
             logging.error(f"Failed to save database index: {e}")
 
-    def _load_existing_releases(self, game_name: str) -> List[GameRelease]:
-        """Load existing releases data from file."""
+    def _load_existing_releases(self, game_name: str) -> LazyReleaseList:
+        """Load existing releases data from file, deferring GameRelease construction until accessed."""
         releases_file = self._get_releases_file_path(game_name)
+        releases_jsonl_file = self._get_releases_jsonl_file_path(game_name)
+
+        # Prefer the NDJSON companion, which is parsed one release per line
+        # instead of reading the whole database into a single string first.
+        # Raw releases are kept for the whole run, so their repeated strings are interned.
+        if releases_jsonl_file.exists():
+            try:
+                with open(releases_jsonl_file, 'r', encoding='utf-8') as f:
+                    return LazyReleaseList(intern_release_data(json.loads(line)) for line in f if line.strip())
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
+                logging.warning(f"Failed to load {releases_jsonl_file}, falling back to {releases_file}: {e}")
 
         if releases_file.exists():
             try:
-                with open(releases_file, 'r') as f:
-                    data = json.load(f)
-                    releases = []
-                    for release_dict in data:
-                        release = GameRelease.from_dict(release_dict)
-                        releases.append(release)
-                    return releases
-            except (json.JSONDecodeError, IOError) as e:
+                with open(releases_file, 'r', encoding='utf-8') as f:
+                    return LazyReleaseList(map(intern_release_data, json.load(f)))
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
                 logging.warning(f"Failed to load existing releases for {game_name}: {e}")
 
-        return []
+        return LazyReleaseList()
 
-    def _save_releases(self, game_name: str, releases: List[GameRelease]) -> None:
+    def _save_releases(self, game_name: str, releases: LazyReleaseList) -> None:
         """Save releases data to file and update database index."""
         self._ensure_game_directory(game_name)
         releases_file = self._get_releases_file_path(game_name)
@@ -276,34 +469,36 @@ class ReleaseDBBuilder:
         stable_releases_jsonl_file = self._get_stable_releases_jsonl_file_path(game_name)
 
         try:
-            # Sort releases by published_at date (newest first), fallback to created_at, then to epoch for None values
-            def get_sort_date(release):
-                from datetime import datetime
-                return release.published_at or release.created_at or datetime.fromtimestamp(0)
-
-            sorted_releases = sorted(releases, key=get_sort_date, reverse=True)
-
-            # Convert GameRelease objects to dictionaries for JSON serialization
-            releases_data = [release.to_dict() for release in sorted_releases]
-            stable_releases_data = [release for release in releases_data if release.get("channel") == "stable"]
-
-            with open(releases_file, 'w') as f:
-                json.dump(releases_data, f, indent=2)
-
-            with open(stable_releases_file, 'w') as f:
-                json.dump(stable_releases_data, f, indent=2)
-
-            with open(releases_jsonl_file, 'w') as f:
-                for release in releases_data:
-                    f.write(json.dumps(release) + "\n")
-
-            with open(stable_releases_jsonl_file, 'w') as f:
-                for release in stable_releases_data:
-                    f.write(json.dumps(release) + "\n")
+            # Sort releases newest first. Existing releases come back already in this order,
+            # so the sort only has to place the appended ones.
+            sorted_releases_data = sorted(releases.to_dicts(), key=self._get_release_sort_date, reverse=True)
+
+            # Serialize each release once per format and share it between the all/stable outputs
+            releases_json = []
+            releases_jsonl = []
+            stable_releases_json = []
+            stable_releases_jsonl = []
+            for release_dict in sorted_releases_data:
+                release_json = json.dumps(release_dict, indent=2)
+                release_jsonl = json.dumps(release_dict) + "\n"
+                releases_json.append(release_json)
+                releases_jsonl.append(release_jsonl)
+                if release_dict.get("channel") == "stable":
+                    stable_releases_json.append(release_json)
+                    stable_releases_jsonl.append(release_jsonl)
+
+            self._write_json_array(releases_file, releases_json)
+            self._write_json_array(stable_releases_file, stable_releases_json)
+
+            with self._atomic_open(releases_jsonl_file) as f:
+                f.writelines(releases_jsonl)
+
+            with self._atomic_open(stable_releases_jsonl_file) as f:
+                f.writelines(stable_releases_jsonl)
 
             logging.info(
                 f"Saved {len(releases)} releases to {releases_file}, "
-                f"{len(stable_releases_data)} stable releases to {stable_releases_file}, "
+                f"{len(stable_releases_json)} stable releases to {stable_releases_file}, "
                 f"and JSONL companions ({releases_jsonl_file}, {stable_releases_jsonl_file})"
             )
 
@@ -313,23 +508,64 @@ class ReleaseDBBuilder:
         except IOError as e:
             logging.error(f"Failed to save releases for {game_name}: {e}")
 
-    def _update_database_index(self, game_name: str) -> None:
-        """Update the database index with current timestamp for the specified game."""
-        try:
-            # Load current index
-            index = self._load_database_index()
+    @staticmethod
+    @contextmanager
+    def _atomic_open(file_path: Path, mode: str = 'w'):
+        """
+        Open a temporary file next to file_path for writing and move it into place on success.
 
-            # Update timestamp for this game (Unix timestamp in seconds)
-            current_timestamp = int(time.time())
-            index[game_name] = {"version": current_timestamp}
-
-            # Save updated index
-            self._save_database_index(index)
+        An interrupted write leaves the previous file intact instead of a truncated one.
+        """
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
+        try:
+            with open(tmp_path, mode) as f:
+                yield f
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _get_release_sort_date(release_dict: Dict) -> datetime:
+        """Sort key for serialized releases: published_at, fallback to created_at, then to epoch for None values."""
+        for key in ("published_at", "created_at"):
+            if release_dict.get(key):
+                try:
+                    return datetime.fromisoformat(release_dict[key])
+                except (ValueError, TypeError):
+                    pass
+        return EPOCH
+
+    @staticmethod
+    def _dump_json(obj, file_path: Path) -> None:
+        """Write an object as compact, key-sorted, newline-terminated JSON (via orjson when available)."""
+        if orjson is not None:
+            with ReleaseDBBuilder._atomic_open(file_path, 'wb') as f:
+                f.write(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE))
+        else:
+            with ReleaseDBBuilder._atomic_open(file_path) as f:
+                json.dump(obj, f, separators=(',', ':'), sort_keys=True)
+                f.write("\n")
+
+    @staticmethod
+    def _write_json_array(file_path: Path, items: List[str]) -> None:
+        """Write items serialized with indent=2 as a JSON array, laid out like json.dump(indent=2)."""
+        with ReleaseDBBuilder._atomic_open(file_path) as f:
+            if not items:
+                f.write("[]")
+                return
+            f.write("[\n  ")
+            f.write(",\n  ".join(item.replace("\n", "\n  ") for item in items))
+            f.write("\n]")
 
-            logging.debug(f"Updated database index for {game_name} with version {current_timestamp}")
+    def _update_database_index(self, game_name: str) -> None:
+        """Update the in-memory database index with current timestamp for the specified game."""
+        # Update timestamp for this game (Unix timestamp in seconds)
+        current_timestamp = int(time.time())
+        self._index[game_name] = {"version": current_timestamp}
+        self._index_dirty = True
 
-        except Exception as e:
-            logging.error(f"Failed to update database index for {game_name}: {e}")
+        logging.debug(f"Updated database index for {game_name} with version {current_timestamp}")
 
     def _has_all_release_outputs(self, game_name: str) -> bool:
         """Check if all expected release output files exist for a game."""
@@ -341,7 +577,7 @@ class ReleaseDBBuilder:
         ]
         return all(path.exists() for path in output_files)
     
-    def build_database(self, game_config: Dict) -> Tuple[List[GameRelease], bool]:
+    def build_database(self, game_config: Dict) -> Tuple[LazyReleaseList, bool]:
         """Build release database for a single game."""
         game_name = game_config['game_name']
         git_repo = game_config['git_repo']
@@ -355,14 +591,14 @@ class ReleaseDBBuilder:
             logging.info(f"Fresh rebuild requested for {game_name} - skipping all cached data")
 
         # Load processed tags cache (skip if fresh rebuild)
-        processed_tags = [] if is_fresh_rebuild else self._load_processed_tags(game_name)
+        processed_tags = set() if is_fresh_rebuild else set(self._load_processed_tags(game_name))
         if is_fresh_rebuild:
             logging.info("Skipping processed tags cache for fresh rebuild")
         else:
             logging.info(f"Loaded {len(processed_tags)} previously processed tags from cache")
 
         # Load failed tags cache (skip if fresh rebuild)
-        failed_tags = [] if is_fresh_rebuild else self._load_failed_tags(game_name)
+        failed_tags = set() if is_fresh_rebuild else set(self._load_failed_tags(game_name))
         if is_fresh_rebuild:
             logging.info("Skipping failed tags cache for fresh rebuild")
         else:
@@ -382,31 +618,52 @@ class ReleaseDBBuilder:
         logging.info(f"Found {len(new_tags)} new tags to process (excluding {len(failed_tags)} previously failed tags)")
 
         # Load existing releases data if it exists (skip if fresh rebuild)
-        releases = [] if is_fresh_rebuild else self._load_existing_releases(game_name)
+        releases = LazyReleaseList() if is_fresh_rebuild else self._load_existing_releases(game_name)
         initial_release_count = len(releases)
         if is_fresh_rebuild:
             logging.info("Skipping existing releases data for fresh rebuild")
         else:
             logging.info(f"Loaded {initial_release_count} existing releases from database")
 
-        # Get release data for each new filtered tag
+        # Look the new tags up in the head of the paginated release listing
+        listed_releases = None
+        if new_tags:
+            etag = None if is_fresh_rebuild else self._load_releases_etag(game_name)
+            new_etag, listed_releases = self.github_client.list_releases(git_repo, set(new_tags), etag)
+            if listed_releases is not None:
+                logging.info(f"Found {len(listed_releases)} of {len(new_tags)} new tags in the release listing")
+                if new_etag:
+                    self._save_releases_etag(game_name, new_etag)
+        if listed_releases is None:
+            listed_releases = {}
+
+        # Tags missing from the listing (or all of them, when the listing is unchanged since the
+        # last run or unavailable) fall back to per-tag requests, fetched concurrently; only a
+        # 404 there means the tag has no release.
+        # Results are consumed in tag order so the saved output stays deterministic.
+        unlisted_tags = [tag for tag in new_tags if tag not in listed_releases]
+        fetched_releases = dict(zip(unlisted_tags, self._fetch_releases(git_repo, unlisted_tags, game_name)))
+        results = (
+            self.github_client.parse_release(listed_releases[tag], game_name) if tag in listed_releases
+            else fetched_releases[tag]
+            for tag in new_tags
+        )
         new_releases_added = 0
-        for i, tag in enumerate(new_tags, 1):
+        for i, (tag, release_data) in enumerate(zip(new_tags, results), 1):
             logging.info(f"Processing new tag {i}/{len(new_tags)}: {tag}")
 
-            release_data = self.github_client.get_release_by_tag(git_repo, tag, game_name)
-            if release_data:
+            if release_data is _RETRY_LATER:
+                # Not cached as failed, so the tag is looked up again on the next run
+                continue
+            elif release_data:
                 releases.append(release_data)
-                processed_tags.append(tag)
+                processed_tags.add(tag)
                 new_releases_added += 1
                 logging.debug(f"Successfully processed tag: {tag}")
             else:
-                failed_tags.append(tag)
+                failed_tags.add(tag)
                 logging.debug(f"No release found for tag: {tag}")
 
-            # Small delay to be respectful to GitHub API
-            time.sleep(0.1)
-
         # Update caches
         if new_tags:
             self._save_processed_tags(game_name, processed_tags)
@@ -423,6 +680,21 @@ class ReleaseDBBuilder:
 
         return releases, releases_changed
     
+    def _fetch_release(self, git_repo: str, tag: str, game_name: str):
+        """Fetch the release of a tag, returning _RETRY_LATER instead of raising when the lookup failed."""
+        try:
+            return self.github_client.get_release_by_tag(git_repo, tag, game_name)
+        except GitHubAPIError as e:
+            logging.warning(f"{e}; will retry on the next run")
+            return _RETRY_LATER
+
+    def _fetch_releases(self, git_repo: str, tags: List[str], game_name: str) -> List:
+        """Fetch the releases of several tags concurrently, returning the _fetch_release results in tag order."""
+        if not tags:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda tag: self._fetch_release(git_repo, tag, game_name), tags))
+
     def run(self) -> None:
         """Run the database builder for all configured games."""
         # Validate fresh games list against configured games
@@ -435,30 +707,36 @@ class ReleaseDBBuilder:
             if valid_fresh_games:
                 logging.info(f"Valid games for fresh rebuild: {sorted(valid_fresh_games)}")
 
-        for game_config in self.config['games']:
-            try:
-                releases, releases_changed = self.build_database(game_config)
-
-                game_name = game_config['game_name']
-
-                # For fresh rebuilds, always save even if no new releases were added
-                # since we're rebuilding from scratch
-                is_fresh_rebuild = game_name in self.fresh_games
-                has_all_outputs = self._has_all_release_outputs(game_name)
-
-                if releases_changed or is_fresh_rebuild or not has_all_outputs:
-                    self._save_releases(game_name, releases)
-                    if is_fresh_rebuild:
-                        logging.info(f"Fresh rebuild completed for {game_name}")
-                    elif not has_all_outputs:
-                        logging.info(f"Missing output files detected for {game_name}; regenerated all outputs")
+        try:
+            for game_config in self.config['games']:
+                try:
+                    releases, releases_changed = self.build_database(game_config)
+
+                    game_name = game_config['game_name']
+
+                    # For fresh rebuilds, always save even if no new releases were added
+                    # since we're rebuilding from scratch
+                    is_fresh_rebuild = game_name in self.fresh_games
+                    has_all_outputs = self._has_all_release_outputs(game_name)
+
+                    if releases_changed or is_fresh_rebuild or not has_all_outputs:
+                        self._save_releases(game_name, releases)
+                        if is_fresh_rebuild:
+                            logging.info(f"Fresh rebuild completed for {game_name}")
+                        elif not has_all_outputs:
+                            logging.info(f"Missing output files detected for {game_name}; regenerated all outputs")
+                        else:
+                            logging.info(f"Database updated for {game_name}")
                     else:
-                        logging.info(f"Database updated for {game_name}")
-                else:
-                    logging.info(f"No changes for {game_name}, skipping save and index update")
+                        logging.info(f"No changes for {game_name}, skipping save and index update")
 
-            except Exception as e:
-                logging.error(f"Failed to build database for {game_config['game_name']}: {e}")
+                except Exception as e:
+                    logging.error(f"Failed to build database for {game_config['game_name']}: {e}")
+        finally:
+            # Write the index once for all games, even if the run is interrupted
+            if self._index_dirty:
+                self._save_database_index(self._index)
+                self._index_dirty = False
 
 
 def main():
@@ -468,6 +746,8 @@ def main():
     parser.add_argument("--token", help="GitHub API token (optional)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--fresh", help="Comma-separated list of game names to rebuild fresh (skip all cached data)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Number of concurrent GitHub API requests (default: {DEFAULT_MAX_WORKERS})")
 
     args = parser.parse_args()
     
@@ -485,7 +765,7 @@ def main():
         logging.info(f"Fresh rebuild requested for games: {fresh_games}")
 
     try:
-        builder = ReleaseDBBuilder(args.config, args.token, fresh_games)
+        builder = ReleaseDBBuilder(args.config, args.token, fresh_games, max(1, args.workers))
         builder.run()
         
     except Exception as e:
@@ -5,13 +5,27 @@ Asset Reprocessing Script
 This script reprocesses existing release databases to apply improved asset classification.
 """
 
+import argparse
 import json
 import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any
-from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 
-from release import AssetPlatform, AssetArch, AssetGraphics, AssetSounds, ReleaseAsset, GameRelease
+from release import CLASSIFIER_VERSION, classify_filename
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_root_logger = logging.getLogger()
+
+# Buffer size for streaming release databases, large enough to batch many small per-release writes
+IO_BUFFER_SIZE = 1 << 20
 
 
 def setup_logging():
@@ -22,11 +36,24 @@ def setup_logging():
     )
 
 
+def encode_json(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Encode an object as JSON bytes (indent=2 when pretty).
+
+    Always uses the json module, so the published databases are byte-for-byte what the builder
+    writes; orjson's separators and raw UTF-8 output would differ. orjson is only used for parsing.
+    """
+    return json.dumps(obj, indent=2 if pretty else None).encode()
+
+
 def load_release_database(file_path: Path) -> List[Dict[str, Any]]:
     """Load the existing release database from JSON file."""
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(file_path.read_bytes())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         logging.info(f"Loaded {len(data)} releases from {file_path}")
         return data
     except (json.JSONDecodeError, IOError) as e:
@@ -34,128 +61,296 @@ def load_release_database(file_path: Path) -> List[Dict[str, Any]]:
         raise
 
 
-def save_release_database(file_path: Path, releases_data: List[Dict[str, Any]]):
-    """Save the updated release database and derived outputs."""
-    try:
-        filename = file_path.name
-        if filename.endswith('_releases.json'):
-            game_name = filename[:-len('_releases.json')]
-        else:
-            game_name = file_path.stem
+def get_game_name(file_path: Path) -> str:
+    """Get the game name from a release database path."""
+    filename = file_path.name
+    if filename.endswith('_releases.json'):
+        return filename[:-len('_releases.json')]
+    return file_path.stem
 
-        stable_releases_file = file_path.parent / f"{game_name}_stable_releases.json"
-        releases_jsonl_file = file_path.parent / f"{game_name}_releases.jsonl"
-        stable_releases_jsonl_file = file_path.parent / f"{game_name}_stable_releases.jsonl"
 
-        stable_releases_data = [release for release in releases_data if release.get('channel') == 'stable']
+def get_derived_output_paths(file_path: Path) -> Tuple[Path, Path, Path]:
+    """Get the stable JSON, JSONL and stable JSONL paths derived from a release database path."""
+    game_name = get_game_name(file_path)
 
-        with open(file_path, 'w') as f:
-            json.dump(releases_data, f, indent=2)
+    return (
+        file_path.parent / f"{game_name}_stable_releases.json",
+        file_path.parent / f"{game_name}_releases.jsonl",
+        file_path.parent / f"{game_name}_stable_releases.jsonl",
+    )
 
-        with open(stable_releases_file, 'w') as f:
-            json.dump(stable_releases_data, f, indent=2)
 
-        with open(releases_jsonl_file, 'w') as f:
-            for release in releases_data:
-                f.write(json.dumps(release) + "\n")
+def _json_array_layout_matches(path: Path, pretty: bool) -> bool:
+    """Check whether a JSON array file is laid out indented (pretty) or compact as requested."""
+    with open(path, 'rb') as f:
+        start = f.read(2)
+    # Empty arrays are written as "[]" in both layouts
+    return start == b"[]" or start == (b"[\n" if pretty else b"[{")
 
-        with open(stable_releases_jsonl_file, 'w') as f:
-            for release in stable_releases_data:
-                f.write(json.dumps(release) + "\n")
 
-        logging.info(
-            f"Saved {len(releases_data)} releases to {file_path}, "
-            f"{len(stable_releases_data)} stable releases to {stable_releases_file}, "
-            f"and JSONL companions ({releases_jsonl_file}, {stable_releases_jsonl_file})"
-        )
+def outputs_up_to_date(file_path: Path, pretty: bool) -> bool:
+    """Check that every output of a release database exists and its JSON arrays use the requested layout."""
+    stable_releases_file, releases_jsonl_file, stable_releases_jsonl_file = get_derived_output_paths(file_path)
+    output_paths = (file_path, stable_releases_file, releases_jsonl_file, stable_releases_jsonl_file)
+
+    if not all(path.exists() for path in output_paths):
+        return False
+    return all(_json_array_layout_matches(path, pretty) for path in (file_path, stable_releases_file))
+
+
+def get_classifier_version_file_path(file_path: Path) -> Path:
+    """Get the path of the file recording which classifier version a release database was reprocessed with."""
+    return file_path.parent / f"{get_game_name(file_path)}_classifier_version.json"
+
+
+def load_classifier_version(file_path: Path) -> Optional[str]:
+    """Load the classifier version a release database was last reprocessed with."""
+    version_file = get_classifier_version_file_path(file_path)
+
+    if version_file.exists():
+        try:
+            with open(version_file, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logging.warning(f"Failed to load classifier version from {version_file}: {e}")
+
+    return None
+
+
+def save_classifier_version(file_path: Path, version: str) -> None:
+    """Record the classifier version a release database was reprocessed with."""
+    version_file = get_classifier_version_file_path(file_path)
+    temporary_file = version_file.with_name(version_file.name + '.tmp')
+
+    try:
+        temporary_file.write_bytes(encode_json(version) + b"\n")
+        os.replace(temporary_file, version_file)
     except IOError as e:
-        logging.error(f"Failed to save release database to {file_path}: {e}")
+        logging.error(f"Failed to save classifier version to {version_file}: {e}")
+
+
+def iter_release_database(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the releases of a database one at a time.
+
+    Releases are streamed from the JSONL companion when it exists, so only one release
+    is held in memory; otherwise the JSON database is loaded as a whole.
+    """
+    _, releases_jsonl_file, _ = get_derived_output_paths(file_path)
+
+    if not releases_jsonl_file.exists():
+        yield from load_release_database(file_path)
+        return
+
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        with open(releases_jsonl_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+    except (json.JSONDecodeError, IOError) as e:
+        logging.error(f"Failed to load release database from {releases_jsonl_file}: {e}")
         raise
 
 
-def update_asset_descriptors(asset_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Update asset descriptors using improved classification logic."""
+class ReleaseDatabaseWriter:
+    """
+    Incrementally write a release database and its derived outputs.
+
+    Releases are appended one at a time to temporary files next to the outputs, which
+    replace the outputs only once the writer is closed without an error or a discard.
+    The JSON arrays are indented like the builder's output unless ``pretty`` is False.
+    """
+
+    def __init__(self, file_path: Path, pretty: bool = True):
+        self.file_path = file_path
+        self.pretty = pretty
+        self.stable_releases_file, self.releases_jsonl_file, self.stable_releases_jsonl_file = \
+            get_derived_output_paths(file_path)
+        self.release_count = 0
+        self.stable_release_count = 0
+        self.discarded = False
+        self._files = {}
+
+    def __enter__(self) -> 'ReleaseDatabaseWriter':
+        try:
+            for path in self.output_paths():
+                self._files[path] = open(self._temporary_path(path), 'wb', buffering=IO_BUFFER_SIZE)
+        except IOError:
+            self._close(success=False)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._close(success=exc_type is None and not self.discarded)
+
+    def write(self, release: Dict[str, Any]) -> None:
+        """Append a release to the database and, if it is stable, to the stable outputs."""
+        release_jsonl = encode_json(release) + b"\n"
+        release_json = encode_json(release, pretty=True) if self.pretty else release_jsonl[:-1]
+
+        self._write_array_item(self._files[self.file_path], release_json, self.release_count)
+        self._files[self.releases_jsonl_file].write(release_jsonl)
+        self.release_count += 1
+
+        if release.get('channel') == 'stable':
+            self._write_array_item(self._files[self.stable_releases_file], release_json, self.stable_release_count)
+            self._files[self.stable_releases_jsonl_file].write(release_jsonl)
+            self.stable_release_count += 1
+
+    def discard(self) -> None:
+        """Drop everything written so far, leaving the existing outputs untouched on close."""
+        self.discarded = True
+
+    def output_paths(self) -> Tuple[Path, Path, Path, Path]:
+        """Get the database, stable JSON, JSONL and stable JSONL output paths."""
+        return self.file_path, self.stable_releases_file, self.releases_jsonl_file, self.stable_releases_jsonl_file
+
+    def _write_array_item(self, f, item_json: bytes, index: int) -> None:
+        """Write an encoded item into a JSON array laid out like a whole-array dump."""
+        if not self.pretty:
+            f.write(b"[" if index == 0 else b",")
+            f.write(item_json)
+            return
+
+        f.write(b"[\n  " if index == 0 else b",\n  ")
+        f.write(item_json.replace(b"\n", b"\n  "))
+
+    def _close(self, success: bool) -> None:
+        """Close the temporary files and move them over the outputs, or discard them on failure."""
+        try:
+            if success:
+                array_end = b"\n]" if self.pretty else b"]"
+                self._files[self.file_path].write(array_end if self.release_count else b"[]")
+                self._files[self.stable_releases_file].write(array_end if self.stable_release_count else b"[]")
+        finally:
+            for f in self._files.values():
+                f.close()
+
+        for path in self._files:
+            if success:
+                os.replace(self._temporary_path(path), path)
+            else:
+                self._temporary_path(path).unlink(missing_ok=True)
+        self._files = {}
+
+    @staticmethod
+    def _temporary_path(path: Path) -> Path:
+        return path.with_name(path.name + '.tmp')
+
+
+def update_asset_descriptors(asset_data: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """Update asset descriptors in place, returning the asset and whether it changed."""
     filename = asset_data.get('name', '')
     
-    # Apply new classification methods
-    platform = AssetPlatform.infer_from_filename(filename)
-    arch = AssetArch.infer_from_filename(filename)
-    graphics = AssetGraphics.infer_from_filename(filename)
-    sounds = AssetSounds.infer_from_filename(filename)
-    
-    # Create updated asset data
-    updated_asset = asset_data.copy()
+    # Apply new classification methods (classify_filename memoizes results per filename)
+    platform, arch, graphics, sounds = classify_filename(filename)
+    platform, arch, graphics, sounds = platform._value_, arch._value_, graphics._value_, sounds._value_
     
     # Update platform (convert from string to enum value)
-    old_platform = updated_asset.get('platform')
-    updated_asset['platform'] = platform.value
+    old_platform = asset_data.get('platform')
+    asset_data['platform'] = platform
     
     # Add architecture field (new)
-    updated_asset['arch'] = arch.value
+    had_arch = 'arch' in asset_data
+    old_arch = asset_data.get('arch')
+    asset_data['arch'] = arch
     
     # Update graphics (convert from boolean to enum value)
-    old_graphics = updated_asset.get('graphics')
-    updated_asset['graphics'] = graphics.value
+    old_graphics = asset_data.get('graphics')
+    asset_data['graphics'] = graphics
     
     # Update sounds (convert from boolean to enum value)
-    old_sounds = updated_asset.get('sounds')
-    updated_asset['sounds'] = sounds.value
+    old_sounds = asset_data.get('sounds')
+    asset_data['sounds'] = sounds
     
-    # Log changes if any
-    changes = []
-    if old_platform != platform.value:
-        changes.append(f"platform: {old_platform} -> {platform.value}")
-    if 'arch' not in asset_data:
-        changes.append(f"arch: added -> {arch.value}")
-    if isinstance(old_graphics, bool):
-        changes.append(f"graphics: {old_graphics} -> {graphics.value}")
-    if isinstance(old_sounds, bool):
-        changes.append(f"sounds: {old_sounds} -> {sounds.value}")
+    changed = old_platform != platform or old_arch != arch or old_graphics != graphics or old_sounds != sounds
     
-    if changes:
-        logging.debug(f"Asset '{filename}': {', '.join(changes)}")
+    # Log changes if any, only building the message when it will be emitted
+    if changed and _root_logger.isEnabledFor(logging.DEBUG):
+        changes = []
+        if old_platform != platform:
+            changes.append(f"platform: {old_platform} -> {platform}")
+        if not had_arch:
+            changes.append(f"arch: added -> {arch}")
+        elif old_arch != arch:
+            changes.append(f"arch: {old_arch} -> {arch}")
+        if old_graphics != graphics:
+            changes.append(f"graphics: {old_graphics} -> {graphics}")
+        if old_sounds != sounds:
+            changes.append(f"sounds: {old_sounds} -> {sounds}")
+        logging.debug("Asset '%s': %s", filename, ', '.join(changes))
     
-    return updated_asset
+    return asset_data, changed
 
 
-def reprocess_release_database(file_path: Path):
-    """Reprocess the release database with improved asset descriptors."""
+def create_backups(paths: Iterable[Path]) -> None:
+    """Back up the existing release database outputs to ``<name>.backup`` files before they are replaced."""
+    for path in paths:
+        if not path.exists():
+            continue
+
+        # The outputs are rewritten through os.replace, so a hard link keeps the original contents
+        backup_file = path.with_name(path.name + '.backup')
+        logging.info(f"Creating backup at {backup_file}")
+        backup_file.unlink(missing_ok=True)
+        try:
+            os.link(path, backup_file)
+        except OSError:
+            shutil.copyfile(path, backup_file)
+
+
+def reprocess_release_database(file_path: Path, backup: bool = False, pretty: bool = True):
+    """
+    Reprocess the release database with improved asset descriptors.
+
+    The database is only rewritten when an asset changed, one of its derived outputs is missing,
+    or its JSON arrays are not in the requested layout.
+    With ``backup``, all four outputs are backed up first: the JSONL companion is what both this
+    script and the builder read, so restoring only the JSON array would not undo a reprocess.
+    ``pretty`` selects indented or compact JSON arrays.
+    """
     logging.info(f"Starting reprocessing of {file_path}")
     
-    # Load existing database
-    releases_data = load_release_database(file_path)
-    
     total_assets = 0
     updated_assets = 0
     
-    # Process each release
-    for release_idx, release_data in enumerate(releases_data):
-        release_name = release_data.get('name', f'Release {release_idx}')
-        assets = release_data.get('assets', [])
-        
-        logging.info(f"Processing release '{release_name}' with {len(assets)} assets")
-        
-        # Process each asset in the release
-        updated_release_assets = []
-        for asset_data in assets:
-            total_assets += 1
-            
-            # Update asset descriptors
-            original_asset = asset_data.copy()
-            updated_asset = update_asset_descriptors(asset_data)
-            
-            # Check if any changes were made
-            if updated_asset != original_asset:
-                updated_assets += 1
+    # Stream each release from the existing database into the updated one
+    try:
+        with ReleaseDatabaseWriter(file_path, pretty) as writer:
+            for release_idx, release_data in enumerate(iter_release_database(file_path)):
+                release_name = release_data.get('name', f'Release {release_idx}')
+                assets = release_data.get('assets', [])
+                
+                logging.info(f"Processing release '{release_name}' with {len(assets)} assets")
+                
+                # Update each asset of the release in place
+                for asset_data in assets:
+                    total_assets += 1
+                    
+                    _, changed = update_asset_descriptors(asset_data)
+                    
+                    if changed:
+                        updated_assets += 1
+                
+                writer.write(release_data)
             
-            updated_release_assets.append(updated_asset)
-        
-        # Update the release with the new asset data
-        release_data['assets'] = updated_release_assets
-    
-    # Save the updated database
-    save_release_database(file_path, releases_data)
+            if updated_assets == 0 and outputs_up_to_date(file_path, pretty):
+                writer.discard()
+            elif backup:
+                create_backups(writer.output_paths())
+    except IOError as e:
+        logging.error(f"Failed to save release database to {file_path}: {e}")
+        raise
     
+    if writer.discarded:
+        logging.info(f"No assets changed, leaving {file_path} untouched")
+    else:
+        logging.info(
+            f"Saved {writer.release_count} releases to {file_path}, "
+            f"{writer.stable_release_count} stable releases to {writer.stable_releases_file}, "
+            f"and JSONL companions ({writer.releases_jsonl_file}, {writer.stable_releases_jsonl_file})"
+        )
     logging.info(f"Reprocessing complete: {updated_assets}/{total_assets} assets updated")
     return updated_assets, total_assets
 
@@ -168,20 +363,54 @@ def find_all_release_databases(base_path: Path) -> List[Path]:
         logging.warning(f"Database directory not found: {base_path}")
         return db_files
 
-    # Look for all game directories
-    for game_dir in base_path.iterdir():
-        if game_dir.is_dir():
-            # Look for the releases JSON file
-            releases_file = game_dir / f"{game_dir.name}_releases.json"
-            if releases_file.exists():
-                db_files.append(releases_file)
-                logging.info(f"Found database: {releases_file}")
+    # Look for all game directories; scandir entries carry their file type, saving a stat per entry
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # Look for the releases JSON file
+                releases_file = base_path / entry.name / f"{entry.name}_releases.json"
+                if releases_file.exists():
+                    db_files.append(releases_file)
+                    logging.info(f"Found database: {releases_file}")
 
     return db_files
 
 
+def _process_one(db_file: Path, pretty: bool = True) -> Tuple[int, int, bool]:
+    """Reprocess a single database, returning (updated assets, total assets, success)."""
+    try:
+        logging.info(f"\n{'='*60}")
+        logging.info(f"Processing database: {db_file}")
+        logging.info(f"{'='*60}")
+
+        # Skip databases whose assets were already classified with the current rules, unless one
+        # of their outputs is missing or has to be rewritten in the requested layout
+        if outputs_up_to_date(db_file, pretty) and load_classifier_version(db_file) == CLASSIFIER_VERSION:
+            logging.info(f"Skipping {db_file}: already reprocessed with classifier version {CLASSIFIER_VERSION}")
+            return 0, 0, True
+
+        # Reprocess the database, backing it up first if it gets rewritten
+        updated_count, asset_count = reprocess_release_database(db_file, backup=True, pretty=pretty)
+        save_classifier_version(db_file, CLASSIFIER_VERSION)
+
+        logging.info(f"Successfully reprocessed {db_file}")
+        logging.info(f"Updated {updated_count} out of {asset_count} assets")
+
+        return updated_count, asset_count, True
+
+    except Exception as e:
+        logging.error(f"Failed to reprocess {db_file}: {e}")
+        return 0, 0, False
+
+
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Reprocess release databases with the latest asset classification")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write the JSON databases without indentation (faster to write and smaller)")
+
+    args = parser.parse_args()
+
     setup_logging()
 
     # Define the base database directory
@@ -201,34 +430,16 @@ def main():
     processed_databases = 0
     failed_databases = 0
 
-    # Process each database
-    for db_file in db_files:
-        try:
-            logging.info(f"\n{'='*60}")
-            logging.info(f"Processing database: {db_file}")
-            logging.info(f"{'='*60}")
-
-            # Create backup
-            backup_file = db_file.with_suffix('.json.backup')
-            logging.info(f"Creating backup at {backup_file}")
-            with open(db_file, 'r') as src, open(backup_file, 'w') as dst:
-                dst.write(src.read())
-
-            # Reprocess the database
-            updated_count, asset_count = reprocess_release_database(db_file)
-
-            total_updated_assets += updated_count
-            total_assets += asset_count
-            processed_databases += 1
-
-            logging.info(f"Successfully reprocessed {db_file}")
-            logging.info(f"Updated {updated_count} out of {asset_count} assets")
-            logging.info(f"Backup saved to {backup_file}")
-
-        except Exception as e:
-            logging.error(f"Failed to reprocess {db_file}: {e}")
-            failed_databases += 1
-            continue
+    # Databases are independent, so process them in parallel
+    max_workers = min(len(db_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=setup_logging) as executor:
+        for updated_count, asset_count, success in executor.map(_process_one, db_files, repeat(not args.compact)):
+            if success:
+                total_updated_assets += updated_count
+                total_assets += asset_count
+                processed_databases += 1
+            else:
+                failed_databases += 1
 
     # Summary
     logging.info(f"\n{'='*60}")